@@ -33,9 +33,16 @@ def run_git(args, cwd=ROOT_DIR, check=True):
         sys.exit(1)
 
 def run_pip(args, cwd=ROOT_DIR, check=True):
+    # Prefer uv when installed: parallel downloads and cached wheels make
+    # cold installs far faster than pip. Same CLI verbs, so args pass through.
+    uv_path = shutil.which("uv")
+    if uv_path:
+        command = [uv_path, "pip"] + args + ["--python", sys.executable]
+    else:
+        command = [sys.executable, "-m", "pip"] + args
     try:
         result = subprocess.run(
-            [sys.executable, "-m", "pip"] + args,
+            command,
             cwd=cwd
         )
         if check and result.returncode != 0:
@@ -63,13 +70,15 @@ def has_merge_head():
 
 def _env_key_from_line(line):
     stripped = line.strip()
-    if not stripped or stripped.startswith("#"):
+    if not stripped or stripped[0] == "#":
         return None
     if stripped.startswith("export "):
         stripped = stripped[7:].lstrip()
-    if "=" not in stripped:
+    # partition scans once and signals a missing '=' via an empty separator.
+    key, sep, _ = stripped.partition("=")
+    if not sep:
         return None
-    key = stripped.split("=", 1)[0].strip()
+    key = key.strip()
     return key or None
 
 def merge_env_template(template_path, env_path):
@@ -82,27 +91,29 @@ def merge_env_template(template_path, env_path):
         print("Created .env from .env-template.")
         return
 
+    # Stream both files line by line instead of materializing full line lists.
+    existing_keys = set()
+    last_env_line = None
     with open(env_path, "r", encoding="utf-8") as env_file:
-        env_lines = env_file.read().splitlines()
-    existing_keys = {
-        key for key in (_env_key_from_line(line) for line in env_lines) if key
-    }
+        for line in env_file:
+            last_env_line = line
+            key = _env_key_from_line(line)
+            if key:
+                existing_keys.add(key)
 
     with open(template_path, "r", encoding="utf-8") as template_file:
-        template_lines = template_file.read().splitlines()
-
-    lines_to_add = []
-    for line in template_lines:
-        key = _env_key_from_line(line)
-        if key and key not in existing_keys:
-            lines_to_add.append(line)
+        lines_to_add = [
+            line.rstrip("\n")
+            for line in template_file
+            if (key := _env_key_from_line(line)) and key not in existing_keys
+        ]
 
     if not lines_to_add:
         print(".env already has all entries from .env-template. No changes needed.")
         return
 
     with open(env_path, "a", encoding="utf-8") as env_file:
-        if env_lines and env_lines[-1] != "":
+        if last_env_line is not None and last_env_line.rstrip("\n") != "":
             env_file.write("\n")
         env_file.write("\n".join(lines_to_add))
         env_file.write("\n")
@@ -176,10 +187,9 @@ run_git([
 
 if has_merge_head():
     # --- CLEANUP STEP 1: Remove temporary files from the merge commit ---
-    # 1. Remove the setup script so it isn't committed
-    run_git(["rm", "-f", "--ignore-unmatch", "scripts/setup.py"], check=False)
-    # 2. Remove the dummy file so it isn't committed
-    run_git(["rm", "-f", "--ignore-unmatch", "in_game/common/dummy.txt"], check=False)
+    # Remove the setup script and the dummy file so they aren't committed.
+    # Single git invocation; each spawn costs ~100 ms on Windows.
+    run_git(["rm", "-f", "--ignore-unmatch", "scripts/setup.py", "in_game/common/dummy.txt"], check=False)
 
     # Finalize the commit.
     run_git(["commit", "-m", "Link devkit history"])
@@ -198,8 +208,7 @@ if overwrite:
 
     # --- CLEANUP STEP 2: Remove temporary files from the overwrite stage ---
     # Remove them again because 'checkout' brought them back from the remote
-    run_git(["rm", "-f", "--ignore-unmatch", "scripts/setup.py"], check=False)
-    run_git(["rm", "-f", "--ignore-unmatch", "in_game/common/dummy.txt"], check=False)
+    run_git(["rm", "-f", "--ignore-unmatch", "scripts/setup.py", "in_game/common/dummy.txt"], check=False)
 
     final_messages.append("--- Devkit Linked Successfully ---")
     final_messages.append("If there were any conflicts, they will now appear as uncommited changes for review.")
@@ -4,10 +4,13 @@ import sys
 import json
 import html
 import hashlib
+import functools
+import random
 import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 import urllib.parse
-import urllib.error
+import http.client
+import threading
 import deepl
 from dotenv import load_dotenv
 import tomllib
@@ -20,7 +23,8 @@ load_dotenv()
 AUTH_KEY = os.getenv("DEEPL_API_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = "gemini-3-flash-preview"
-GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models"
+GEMINI_API_HOST = "generativelanguage.googleapis.com"
+GEMINI_API_PATH = "/v1beta/models"
 
 if not AUTH_KEY:
 	print("Error: DEEPL_API_KEY not found in .env file.")
@@ -46,32 +50,25 @@ ALLOWED_WORKSHOP_DESCRIPTION_TRANSLATORS = {"deepl", "gemini-3-flash"}
 ALLOWED_WORKSHOP_TITLE_TRANSLATORS = {"deepl", "gemini-3-flash"}
 ALLOWED_LOCALIZATION_TRANSLATORS = {"deepl", "gemini-3-flash"}
 
+# "deepl" is the source-language code; "deepl_target" the (sometimes regional)
+# code DeepL expects as a translation target.
 LANGUAGE_CONFIG = {
-	"english": {"deepl": "EN", "loc_id": "l_english"},
-	"french": {"deepl": "FR", "loc_id": "l_french"},
-	"german": {"deepl": "DE", "loc_id": "l_german"},
-	"spanish": {"deepl": "ES", "loc_id": "l_spanish"},
-	"polish": {"deepl": "PL", "loc_id": "l_polish"},
-	"russian": {"deepl": "RU", "loc_id": "l_russian"},
-	"simp_chinese": {"deepl": "ZH", "loc_id": "l_simp_chinese"},
-	"turkish": {"deepl": "TR", "loc_id": "l_turkish"},
-	"braz_por": {"deepl": "PT", "loc_id": "l_braz_por"},
-	"japanese": {"deepl": "JA", "loc_id": "l_japanese"},
-	"korean": {"deepl": "KO", "loc_id": "l_korean"}
+	"english": {"deepl": "EN", "deepl_target": "EN", "loc_id": "l_english"},
+	"french": {"deepl": "FR", "deepl_target": "FR", "loc_id": "l_french"},
+	"german": {"deepl": "DE", "deepl_target": "DE", "loc_id": "l_german"},
+	"spanish": {"deepl": "ES", "deepl_target": "ES", "loc_id": "l_spanish"},
+	"polish": {"deepl": "PL", "deepl_target": "PL", "loc_id": "l_polish"},
+	"russian": {"deepl": "RU", "deepl_target": "RU", "loc_id": "l_russian"},
+	"simp_chinese": {"deepl": "ZH", "deepl_target": "ZH", "loc_id": "l_simp_chinese"},
+	"turkish": {"deepl": "TR", "deepl_target": "TR", "loc_id": "l_turkish"},
+	"braz_por": {"deepl": "PT", "deepl_target": "PT-BR", "loc_id": "l_braz_por"},
+	"japanese": {"deepl": "JA", "deepl_target": "JA", "loc_id": "l_japanese"},
+	"korean": {"deepl": "KO", "deepl_target": "KO", "loc_id": "l_korean"}
 }
 
+# Derived view so the language list only lives in LANGUAGE_CONFIG.
 TARGET_LANGUAGES = {
-	"english": "EN",
-	"polish": "PL",
-	"russian": "RU",
-	"simp_chinese": "ZH",
-	"spanish": "ES",
-	"turkish": "TR",
-	"braz_por": "PT-BR",
-	"french": "FR",
-	"german": "DE",
-	"japanese": "JA",
-	"korean": "KO"
+	name: config["deepl_target"] for name, config in LANGUAGE_CONFIG.items()
 }
 
 LANGUAGE_DISPLAY_NAMES = {
@@ -90,13 +87,38 @@ LANGUAGE_DISPLAY_NAMES = {
 
 # Cache of source key/value hashes to avoid re-translating unchanged lines.
 HASHES_PATH = os.path.join(SCRIPT_DIR, "dependencies", ".translate_hashes.json")
-HASH_FILE_VERSION = 1
+# Version 2: hash_text switched from SHA-256 to BLAKE2b-160; old caches rebuild.
+HASH_FILE_VERSION = 2
 
-KEY_VALUE_RE = re.compile(r'^(\s*)([^:#]+):\s*"(.*)"(.*)$')
+# re.ASCII keeps the engine on the fast ASCII path; keys and structure are ASCII.
+KEY_VALUE_RE = re.compile(r'^(\s*)([^:#]+):\s*"(.*)"(.*)$', re.ASCII)
 HEADER_RE = re.compile(r'^\s*l_[^:]+:\s*$')
 LOCK_RE = re.compile(r'#\s*LOCK\b')
 XML_PLACEHOLDER_TAG = "locvar"
+
+# Hot-loop patterns compiled once at import; re's internal cache still pays a
+# lookup per call, and inline re.compile would rebuild the pattern every call.
+# Single alternation prevents already-masked [VAR_x] tokens from being re-masked.
+MASK_RE = re.compile(r'(\\n|\[[^\]]*\]|\$[^$]*\$|@[a-zA-Z0-9_]+!?|#[a-zA-Z0-9_]+|#!)')
+VAR_TOKEN_RE = re.compile(r'\[VAR_(\d+)\]')
+UNMASK_VAR_RE = re.compile(r'\[?\s*VAR_(\d+)\s*\]?')
+VAR_ID_RE = re.compile(r'VAR_(\d+)')
+XML_PAIR_RE = re.compile(
+	rf'<{XML_PLACEHOLDER_TAG}\s+id=[\'"](\d+)[\'"]\s*>.*?</{XML_PLACEHOLDER_TAG}\s*>',
+	re.DOTALL
+)
+XML_SELF_CLOSING_RE = re.compile(rf'<{XML_PLACEHOLDER_TAG}\s+id=[\'"](\d+)[\'"]\s*/\s*>')
+XML_OPEN_TAG_RE = re.compile(rf'<{XML_PLACEHOLDER_TAG}\s+id=[\'"](\d+)[\'"]')
+SENTENCE_END_RE = re.compile(r'([.!?。！？])\s*$')
+# All cleanup fixes in one alternation so cleanup_text scans the string once.
+CLEANUP_RE = re.compile(r'\s+([,.])|\[\[|\]\]| {2,}')
+SKIP_VAR_RE = re.compile(r'\[VAR_\d+\]')
+SKIP_PUNCT_RE = re.compile(r'[ \t\.,!?:;]')
+# One scan for all three NO-TRANSLATE sentinels; group 1 tells which fired.
+NO_TRANSLATE_RE = re.compile(r'# NO-TRANSLATE( BELOW| END)?')
 DEEPL_SPLIT_SENTENCES_LOCALIZATION = deepl.api_data.SplitSentences.OFF
+# DeepL accepts at most 50 texts per translate_text request.
+DEEPL_MAX_BATCH_TEXTS = 50
 
 # ==========================================
 # LOGIC
@@ -251,7 +273,9 @@ def load_hashes(path):
 		return {"version": HASH_FILE_VERSION, "files": {}}
 
 	try:
-		with open(path, "r", encoding="utf-8") as f:
+		# Binary mode lets json.load sniff the encoding itself and skips
+		# the text-wrapper decode layer.
+		with open(path, "rb") as f:
 			data = json.load(f)
 		if not isinstance(data, dict):
 			raise ValueError("Hash file must be a JSON object.")
@@ -272,37 +296,51 @@ def save_hashes(path, data):
 	os.makedirs(os.path.dirname(path), exist_ok=True)
 	tmp_path = path + ".tmp"
 	with open(tmp_path, "w", encoding="utf-8") as f:
-		json.dump(data, f, indent=2, sort_keys=True)
+		# The cache is machine-read only; compact separators and unsorted
+		# keys skip the per-level sorting and pretty-print whitespace.
+		f.write(json.dumps(data, separators=(",", ":")))
 	os.replace(tmp_path, path)
 
+@functools.lru_cache(maxsize=100_000)
 def hash_text(text):
 	"""
 	Stable hash of the source value to detect changes.
+
+	BLAKE2b is faster than SHA-256 in software and 20 bytes is plenty for
+	change detection; there is no cryptographic requirement here. The LRU
+	cache skips rehashing values repeated across keys and files (defaults,
+	boilerplate strings).
 	"""
-	return hashlib.sha256(text.encode("utf-8")).hexdigest()
+	return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
 
 def mask_text_var(text):
 	"""
 	Replaces blocks with [VAR_0], [VAR_1], etc to prevent DeepL from breaking it.
 	"""
 	placeholders = []
+	seen = {}
 
 	def replace_match(match):
-		idx = len(placeholders)
-		placeholders.append(match.group(0))
+		token = match.group(0)
+		# Repeated tokens share one placeholder so the masked text (and the
+		# hash-keyed translation cache) stays stable across duplicates.
+		idx = seen.get(token)
+		if idx is None:
+			idx = len(placeholders)
+			placeholders.append(token)
+			seen[token] = idx
 		return f'[VAR_{idx}]'
 
-	# Single pass prevents already-masked [VAR_x] tokens from being re-masked.
-	pattern = re.compile(
-		r'(\\n|\[.*?\]|\$.*?\$|@[a-zA-Z0-9_]+!?|#[a-zA-Z0-9_]+|#!)'
-	)
-	text = pattern.sub(replace_match, text)
+	text = MASK_RE.sub(replace_match, text)
 
 	return text, placeholders
 
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 def escape_xml(text):
 	"""Escape XML special chars so DeepL XML tag handling stays valid."""
-	return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+	# str.translate does all three escapes in one scan and one allocation.
+	return text.translate(_XML_ESCAPE)
 
 def unescape_xml(text):
 	"""Reverse escape_xml using standard HTML entity unescape."""
@@ -311,6 +349,8 @@ def unescape_xml(text):
 def mask_text_var_xml_from_masked(masked_text, placeholders):
 	"""Convert [VAR_x] placeholders into XML tags for DeepL tag handling."""
 	escaped = escape_xml(masked_text)
+	if not placeholders:
+		return escaped
 	def replace_match(match):
 		try:
 			idx = int(match.group(1))
@@ -318,12 +358,15 @@ def mask_text_var_xml_from_masked(masked_text, placeholders):
 		except (ValueError, IndexError):
 			placeholder_text = match.group(0)
 		return f'<{XML_PLACEHOLDER_TAG} id="{match.group(1)}">{escape_xml(placeholder_text)}</{XML_PLACEHOLDER_TAG}>'
-	return re.sub(r'\[VAR_(\d+)\]', replace_match, escaped)
+	return VAR_TOKEN_RE.sub(replace_match, escaped)
 
 def unmask_text_var(text, placeholders):
 	"""
 	Restores [VAR_0] -> Original Text.
 	"""
+	if not placeholders:
+		return text
+
 	def restore_match(match):
 		try:
 			idx = int(match.group(1))
@@ -334,12 +377,15 @@ def unmask_text_var(text, placeholders):
 		return match.group(0)
 
 	# Regex matches: Optional [, whitespace, VAR_, Digit, whitespace, Optional ]
-	return re.sub(r'\[?\s*VAR_(\d+)\s*\]?', restore_match, text)
+	return UNMASK_VAR_RE.sub(restore_match, text)
 
 def unmask_text_var_xml(text, placeholders):
 	"""
 	Restores <locvar id="0">...</locvar> -> Original Text.
 	"""
+	if not placeholders:
+		return text
+
 	def restore_match(match):
 		try:
 			idx = int(match.group(1))
@@ -350,18 +396,9 @@ def unmask_text_var_xml(text, placeholders):
 		return match.group(0)
 
 	# Replace paired tags with or without content.
-	text = re.sub(
-		rf'<{XML_PLACEHOLDER_TAG}\s+id=[\'"](\d+)[\'"]\s*>.*?</{XML_PLACEHOLDER_TAG}\s*>',
-		restore_match,
-		text,
-		flags=re.DOTALL
-	)
+	text = XML_PAIR_RE.sub(restore_match, text)
 	# Replace self-closing tags.
-	return re.sub(
-		rf'<{XML_PLACEHOLDER_TAG}\s+id=[\'"](\d+)[\'"]\s*/\s*>',
-		restore_match,
-		text
-	)
+	return XML_SELF_CLOSING_RE.sub(restore_match, text)
 
 def normalize_localization_linebreaks(text):
 	"""Convert raw line breaks to escaped \\n for single-line localization values."""
@@ -370,11 +407,26 @@ def normalize_localization_linebreaks(text):
 
 def missing_placeholder_indices(translated_text, placeholders):
 	"""Return indices of placeholders missing from translated_text (VAR or XML-tagged)."""
-	found_set = set(int(x) for x in re.findall(r'VAR_(\d+)', translated_text))
-	found_set.update(
-		int(x)
-		for x in re.findall(rf'<{XML_PLACEHOLDER_TAG}\s+id=[\'"](\d+)[\'"]', translated_text)
-	)
+	need = len(placeholders)
+	if need == 0:
+		return []
+
+	# Stream matches and stop once every expected index has been seen; the
+	# common all-present case rarely needs the second scan.
+	found_set = set()
+	for match in VAR_ID_RE.finditer(translated_text):
+		idx = int(match.group(1))
+		if idx < need:
+			found_set.add(idx)
+	if len(found_set) < need:
+		for match in XML_OPEN_TAG_RE.finditer(translated_text):
+			idx = int(match.group(1))
+			if idx < need:
+				found_set.add(idx)
+			if len(found_set) == need:
+				break
+	if len(found_set) == need:
+		return []
 
 	missing = []
 	for i, placeholder in enumerate(placeholders):
@@ -396,45 +448,65 @@ def insert_missing_placeholders(text, placeholders, missing_indices):
 	if not text:
 		return suffix
 
-	match = re.search(r'([.!?。！？])\s*$', text)
+	match = SENTENCE_END_RE.search(text)
 	if match:
 		# Keep sentence-ending punctuation last to avoid odd UI output.
 		idx = match.start(1)
 		return text[:idx] + suffix + text[idx:]
 	return text + suffix
 
-def translate_deepl_xml(translator, masked_text, placeholders, deepl_code, source_lang_deepl, split_sentences):
-	"""Translate masked text using XML tag handling."""
-	masked_xml = mask_text_var_xml_from_masked(masked_text, placeholders)
-	result = translator.translate_text(
-		masked_xml,
-		target_lang=deepl_code,
-		source_lang=source_lang_deepl,
-		tag_handling="xml",
-		non_splitting_tags=[XML_PLACEHOLDER_TAG],
-		ignore_tags=[XML_PLACEHOLDER_TAG],
-		split_sentences=split_sentences,
-		preserve_formatting=True
-	)
-	translated_raw = normalize_localization_linebreaks(unescape_xml(result.text))
-	missing = missing_placeholder_indices(translated_raw, placeholders)
-	translated_text = unmask_text_var_xml(translated_raw, placeholders)
-	translated_text = unmask_text_var(translated_text, placeholders)
-	return translated_text, missing
-
-def translate_deepl_plain(translator, masked_text, placeholders, deepl_code, source_lang_deepl, split_sentences):
-	"""Translate masked text without XML tag handling."""
-	result = translator.translate_text(
-		masked_text,
-		target_lang=deepl_code,
-		source_lang=source_lang_deepl,
-		split_sentences=split_sentences,
-		preserve_formatting=True
-	)
-	translated_raw = normalize_localization_linebreaks(result.text)
-	missing = missing_placeholder_indices(translated_raw, placeholders)
-	translated_text = unmask_text_var(translated_raw, placeholders)
-	return translated_text, missing
+def translate_deepl_xml_batch(translator, batch, deepl_code, source_lang_deepl, split_sentences):
+	"""
+	Translate a batch of (masked_text, placeholders) pairs in one request
+	using XML tag handling. Returns a list of (translated_text, missing).
+	"""
+	masked_xml = [
+		mask_text_var_xml_from_masked(masked_text, placeholders)
+		for masked_text, placeholders in batch
+	]
+	results = []
+	for start in range(0, len(masked_xml), DEEPL_MAX_BATCH_TEXTS):
+		results.extend(translator.translate_text(
+			masked_xml[start:start + DEEPL_MAX_BATCH_TEXTS],
+			target_lang=deepl_code,
+			source_lang=source_lang_deepl,
+			tag_handling="xml",
+			non_splitting_tags=[XML_PLACEHOLDER_TAG],
+			ignore_tags=[XML_PLACEHOLDER_TAG],
+			split_sentences=split_sentences,
+			preserve_formatting=True
+		))
+	translated = []
+	for (masked_text, placeholders), result in zip(batch, results):
+		translated_raw = normalize_localization_linebreaks(unescape_xml(result.text))
+		missing = missing_placeholder_indices(translated_raw, placeholders)
+		translated_text = unmask_text_var_xml(translated_raw, placeholders)
+		translated_text = unmask_text_var(translated_text, placeholders)
+		translated.append((translated_text, missing))
+	return translated
+
+def translate_deepl_plain_batch(translator, batch, deepl_code, source_lang_deepl, split_sentences):
+	"""
+	Translate a batch of (masked_text, placeholders) pairs in one request
+	without XML tag handling. Returns a list of (translated_text, missing).
+	"""
+	masked_texts = [masked_text for masked_text, _ in batch]
+	results = []
+	for start in range(0, len(masked_texts), DEEPL_MAX_BATCH_TEXTS):
+		results.extend(translator.translate_text(
+			masked_texts[start:start + DEEPL_MAX_BATCH_TEXTS],
+			target_lang=deepl_code,
+			source_lang=source_lang_deepl,
+			split_sentences=split_sentences,
+			preserve_formatting=True
+		))
+	translated = []
+	for (masked_text, placeholders), result in zip(batch, results):
+		translated_raw = normalize_localization_linebreaks(result.text)
+		missing = missing_placeholder_indices(translated_raw, placeholders)
+		translated_text = unmask_text_var(translated_raw, placeholders)
+		translated.append((translated_text, missing))
+	return translated
 
 def validate_translation(translated_text, placeholders):
 	"""
@@ -452,10 +524,17 @@ def cleanup_text(text):
 	"""
 	Cleans up common AI formatting errors.
 	"""
-	text = re.sub(r'\s+([,.])', r'\1', text) # Fix space before punctuation
-	text = re.sub(r' +', ' ', text)          # Fix double spaces
-	text = text.replace('[[', '[').replace(']]', ']') # Fix double brackets
-	return text.strip()
+	def fix(match):
+		punct = match.group(1)
+		if punct:
+			return punct       # Drop space before punctuation
+		token = match.group(0)
+		if token == '[[':
+			return '['         # Fix double brackets
+		if token == ']]':
+			return ']'
+		return ' '             # Collapse runs of spaces
+	return CLEANUP_RE.sub(fix, text).strip()
 
 def should_auto_skip(masked_text):
 	"""
@@ -468,11 +547,16 @@ def should_auto_skip(masked_text):
 	if not masked_text.strip():
 		return True
 
+	# Fast path: a letter in a line with no VAR_ tokens means real text,
+	# so the regex stripping below could never empty it.
+	if "VAR_" not in masked_text and any(c.isalpha() for c in masked_text):
+		return False
+
 	# 2. Remove all [VAR_x] tags
-	stripped = re.sub(r'\[VAR_\d+\]', '', masked_text)
+	stripped = SKIP_VAR_RE.sub('', masked_text)
 
 	# 3. Remove standard punctuation and whitespace
-	stripped = re.sub(r'[ \t\.,!?:;]', '', stripped)
+	stripped = SKIP_PUNCT_RE.sub('', stripped)
 
 	# If nothing is left, it was only placeholders/punctuation
 	return len(stripped) == 0
@@ -485,12 +569,19 @@ def parse_source_entries(lines):
 	ignore_block_active = False
 
 	for line in lines:
-		if "# NO-TRANSLATE BELOW" in line:
-			ignore_block_active = True
-		if "# NO-TRANSLATE END" in line:
-			ignore_block_active = False
-
-		no_translate = ignore_block_active or ("# NO-TRANSLATE" in line)
+		sentinel = NO_TRANSLATE_RE.search(line)
+		if sentinel:
+			flag = sentinel.group(1)
+			if flag == " BELOW":
+				ignore_block_active = True
+			elif flag == " END":
+				ignore_block_active = False
+
+		no_translate = ignore_block_active or sentinel is not None
+
+		# Cheap prefilter: a key/value line must contain ':' and '"'.
+		if ':' not in line or '"' not in line:
+			continue
 
 		match = KEY_VALUE_RE.match(line)
 		if match:
@@ -544,86 +635,119 @@ def translate_localization_value_gemini(
 	translated_text = unmask_text_var(translated_text, placeholders)
 	return cleanup_text(translated_text)
 
-def translate_value(
+def translate_entries(
 	translator,
-	key,
-	original_value,
+	entries,
 	deepl_code,
 	source_lang_deepl,
 	target_folder_name,
-	no_translate,
 	localization_translator,
-	gemini_localization_system_prompt
+	gemini_localization_system_prompt,
+	translation_cache
 ):
 	"""
-	Translate a single value with tag masking and validation.
+	Translate a list of source entries with tag masking and validation.
+
+	DeepL accepts a list of strings per request, so all entries for a file
+	are sent in one round trip instead of one HTTPS call per line. Results
+	are memoized in translation_cache keyed by source hash and target code,
+	so identical values (across keys, files, or reruns that add a new
+	target language) never hit the API twice.
+	Returns a dict mapping key -> translated text.
 	"""
-	if no_translate:
-		return original_value
+	translations = {}
+	pending = []
 
-	masked_text, placeholders = mask_text_var(original_value)
-
-	if should_auto_skip(masked_text):
-		return original_value
+	for entry in entries:
+		key = entry["key"]
+		original_value = entry["value"]
 
-	if localization_translator == "gemini-3-flash":
-		target_language = LANGUAGE_DISPLAY_NAMES.get(target_folder_name, target_folder_name)
-		translated_text = translate_localization_value_gemini(
-			masked_text,
-			placeholders,
-			target_language,
-			key,
-			target_folder_name,
-			gemini_localization_system_prompt
-		)
-		if translated_text is None:
-			print(f"  [Error] Failed to translate line: {key} (Gemini request failed)")
-			return original_value
-		return translated_text
+		if entry["no_translate"]:
+			translations[key] = original_value
+			continue
 
-	try:
-		split_sentences = DEEPL_SPLIT_SENTENCES_LOCALIZATION if placeholders else None
+		masked_text, placeholders = mask_text_var(original_value)
 
-		translated_text, missing_xml = translate_deepl_xml(
-			translator,
-			masked_text,
-			placeholders,
-			deepl_code,
-			source_lang_deepl,
-			split_sentences
-		)
+		if should_auto_skip(masked_text):
+			translations[key] = original_value
+			continue
 
-		translated_plain = None
-		missing_plain = None
-		if missing_xml:
-			translated_plain, missing_plain = translate_deepl_plain(
-				translator,
+		if localization_translator == "gemini-3-flash":
+			target_language = LANGUAGE_DISPLAY_NAMES.get(target_folder_name, target_folder_name)
+			translated_text = translate_localization_value_gemini(
 				masked_text,
 				placeholders,
+				target_language,
+				key,
+				target_folder_name,
+				gemini_localization_system_prompt
+			)
+			if translated_text is None:
+				print(f"  [Error] Failed to translate line: {key} (Gemini request failed)")
+				translations[key] = original_value
+			else:
+				translations[key] = translated_text
+			continue
+
+		src_hash = hash_text(original_value)
+		cached = translation_cache.get(src_hash, {}).get(deepl_code)
+		if cached is not None:
+			translations[key] = cached
+			continue
+
+		pending.append((key, original_value, src_hash, masked_text, placeholders))
+
+	# split_sentences is a request-wide option, so batch separately for
+	# entries with and without placeholders.
+	for has_placeholders in (True, False):
+		group = [item for item in pending if bool(item[4]) == has_placeholders]
+		if not group:
+			continue
+
+		split_sentences = DEEPL_SPLIT_SENTENCES_LOCALIZATION if has_placeholders else None
+		batch = [(masked_text, placeholders) for _, _, _, masked_text, placeholders in group]
+
+		try:
+			translated = translate_deepl_xml_batch(
+				translator,
+				batch,
 				deepl_code,
 				source_lang_deepl,
 				split_sentences
 			)
 
-		# Choose the translation that preserves more placeholders.
-		if missing_plain is not None and len(missing_plain) < len(missing_xml):
-			translated_text = translated_plain
-			missing = missing_plain
-		else:
-			missing = missing_xml
+			# Retry entries that dropped tags without XML handling, again in
+			# a single request, and keep whichever preserved more placeholders.
+			retry_indices = [i for i, (_, missing) in enumerate(translated) if missing]
+			if retry_indices:
+				plain = translate_deepl_plain_batch(
+					translator,
+					[batch[i] for i in retry_indices],
+					deepl_code,
+					source_lang_deepl,
+					split_sentences
+				)
+				for i, (plain_text, plain_missing) in zip(retry_indices, plain):
+					if len(plain_missing) < len(translated[i][1]):
+						translated[i] = (plain_text, plain_missing)
+		except Exception as e:
+			print(f"  [Error] Failed to translate batch of {len(group)} lines ({e})")
+			for key, original_value, _, _, _ in group:
+				translations[key] = original_value
+			continue
 
-		if missing:
-			missing_tags = [placeholders[i] for i in missing]
-			print(f"  [WARNING] {target_folder_name} issue in '{key}': Missing tags: {missing_tags}")
-			# If the engine drops tags, reinsert them rather than falling back to English.
-			translated_text = insert_missing_placeholders(translated_text, placeholders, missing)
+		for (key, _, src_hash, _, placeholders), (translated_text, missing) in zip(group, translated):
+			if missing:
+				missing_tags = [placeholders[i] for i in missing]
+				print(f"  [WARNING] {target_folder_name} issue in '{key}': Missing tags: {missing_tags}")
+				# If the engine drops tags, reinsert them rather than falling back to English.
+				translated_text = insert_missing_placeholders(translated_text, placeholders, missing)
 
-		translated_text = cleanup_text(translated_text)
-		return translated_text
+			translated_text = cleanup_text(translated_text)
+			translation_cache.setdefault(src_hash, {})[deepl_code] = translated_text
+			translations[key] = translated_text
 
-	except Exception as e:
-		print(f"  [Error] Failed to translate line: {key} ({e})")
-		return original_value
+	return translations
 
 def build_line(indent, key, text, comment):
 	"""Format a localization key/value line with optional comment."""
@@ -657,6 +781,8 @@ def build_target_key_index(lines):
 	"""
 	index = {}
 	for i, line in enumerate(lines):
+		if ':' not in line or '"' not in line:
+			continue
 		match = KEY_VALUE_RE.match(line)
 		if match:
 			index[match.group(2)] = i
@@ -667,6 +793,9 @@ def prune_target_lines(target_lines, source_keys):
 	new_lines = []
 	removed_count = 0
 	for line in target_lines:
+		if ':' not in line or '"' not in line:
+			new_lines.append(line)
+			continue
 		match = KEY_VALUE_RE.match(line)
 		if match and match.group(2) not in source_keys:
 			removed_count += 1
@@ -677,38 +806,49 @@ def prune_target_lines(target_lines, source_keys):
 def update_target_lines(
 	translator,
 	target_lines,
+	target_index,
 	source_entries,
 	changed_keys,
 	deepl_code,
 	source_lang_deepl,
 	target_folder_name,
 	localization_translator,
-	gemini_localization_system_prompt
+	gemini_localization_system_prompt,
+	translation_cache
 ):
 	"""
 	Update only keys that changed in the source (or are missing in the target).
+
+	target_index is the key -> line index map built by the caller; it is
+	kept in sync as new lines are appended.
 	"""
-	target_index = build_target_key_index(target_lines)
 	file_changed = False
 
-	for entry in source_entries:
-		key = entry["key"]
+	pending_entries = [
+		entry for entry in source_entries
+		if entry["key"] in changed_keys or entry["key"] not in target_index
+	]
+	if not pending_entries:
+		return False
 
-		needs_update = key in changed_keys or key not in target_index
-		if not needs_update:
-			continue
+	translations = translate_entries(
+		translator,
+		pending_entries,
+		deepl_code,
+		source_lang_deepl,
+		target_folder_name,
+		localization_translator,
+		gemini_localization_system_prompt,
+		translation_cache
+	)
 
-		translated_text = translate_value(
-			translator,
-			key,
-			entry["value"],
-			deepl_code,
-			source_lang_deepl,
-			target_folder_name,
-			entry["no_translate"],
-			localization_translator,
-			gemini_localization_system_prompt
-		)
+	# Collect new lines and append them in one batch after the loop instead
+	# of growing target_lines (and re-checking its tail) per entry.
+	pending_appends = []
+
+	for entry in pending_entries:
+		key = entry["key"]
+		translated_text = translations.get(key, entry["value"])
 
 		if key in target_index:
 			line_index = target_index[key]
@@ -727,48 +867,69 @@ def update_target_lines(
 				target_lines[line_index] = new_line
 				file_changed = True
 		else:
-			new_line = build_line(entry["indent"], key, translated_text, entry["comment"])
-			if target_lines and not target_lines[-1].endswith("\n"):
-				target_lines[-1] = target_lines[-1] + "\n"
-			target_lines.append(new_line)
-			target_index[key] = len(target_lines) - 1
+			pending_appends.append(
+				(key, build_line(entry["indent"], key, translated_text, entry["comment"]))
+			)
 			file_changed = True
 
+	if pending_appends:
+		if target_lines and not target_lines[-1].endswith("\n"):
+			target_lines[-1] = target_lines[-1] + "\n"
+		for key, new_line in pending_appends:
+			target_index[key] = len(target_lines)
+			target_lines.append(new_line)
+
 	return file_changed
 
 def translate_source_lines(
 	translator,
 	source_lines,
+	source_entries,
 	target_folder_name,
 	deepl_code,
 	source_lang_id,
 	source_lang_deepl,
 	localization_translator,
-	gemini_localization_system_prompt
+	gemini_localization_system_prompt,
+	translation_cache
 ):
 	"""
 	Translate a full source file into a new target file.
 	"""
 	new_lang_id = f"l_{target_folder_name}"
+
+	# One batched request for every translatable entry in the file.
+	translations = translate_entries(
+		translator,
+		source_entries,
+		deepl_code,
+		source_lang_deepl,
+		target_folder_name,
+		localization_translator,
+		gemini_localization_system_prompt,
+		translation_cache
+	)
+
 	new_lines = []
 	ignore_block_active = False
+	header_prefix = f"{source_lang_id}:"
+	header_done = False
 
 	for line in source_lines:
-		stripped_line = line.strip()
-
-		# 1. Handle Language Header
-		if stripped_line.startswith(f"{source_lang_id}:"):
+		# 1. Handle Language Header (appears once, so stop testing after it)
+		if not header_done and line.lstrip().startswith(header_prefix):
 			new_lines.append(f"{new_lang_id}:\n")
+			header_done = True
 			continue
 
 		# 2. Check for ignored lines
-		if "# NO-TRANSLATE BELOW" in line:
-			ignore_block_active = True
-			new_lines.append(line)
-			continue
-
-		if "# NO-TRANSLATE END" in line:
-			ignore_block_active = False
+		sentinel = NO_TRANSLATE_RE.search(line)
+		if sentinel:
+			flag = sentinel.group(1)
+			if flag == " BELOW":
+				ignore_block_active = True
+			elif flag == " END":
+				ignore_block_active = False
 			new_lines.append(line)
 			continue
 
@@ -776,11 +937,11 @@ def translate_source_lines(
 			new_lines.append(line)
 			continue
 
-		if "# NO-TRANSLATE" in line:
+		# 3. Parse Key-Value Pairs
+		if ':' not in line or '"' not in line:
 			new_lines.append(line)
 			continue
 
-		# 3. Parse Key-Value Pairs
 		match = KEY_VALUE_RE.match(line)
 
 		if match:
@@ -789,17 +950,7 @@ def translate_source_lines(
 			original_value = match.group(3)
 			comment = match.group(4) if match.group(4) else ""
 
-			translated_text = translate_value(
-				translator,
-				key,
-				original_value,
-				deepl_code,
-				source_lang_deepl,
-				target_folder_name,
-				False,
-				localization_translator,
-				gemini_localization_system_prompt
-			)
+			translated_text = translations.get(key, original_value)
 
 			new_lines.append(build_line(indent, key, translated_text, comment))
 		else:
@@ -814,12 +965,14 @@ def process_file(
 	source_entries,
 	source_filepath,
 	target_folder_name,
+	target_dir,
 	deepl_code,
 	source_lang_id,
 	source_lang_deepl,
 	changed_keys,
 	localization_translator,
-	gemini_localization_system_prompt
+	gemini_localization_system_prompt,
+	translation_cache
 ):
 	"""Translate/update one localization file for a single target language."""
 	filename = os.path.basename(source_filepath)
@@ -829,8 +982,7 @@ def process_file(
 	else:
 		new_filename = filename
 
-	target_dir = os.path.join(BASE_LOC_PATH, target_folder_name)
-	os.makedirs(target_dir, exist_ok=True)
+	# target_dir is created once in main(), not per file.
 	target_filepath = os.path.join(target_dir, new_filename)
 
 	# If the target doesn't exist yet, write a fully translated file.
@@ -839,29 +991,42 @@ def process_file(
 		new_lines = translate_source_lines(
 			translator,
 			source_lines,
+			source_entries,
 			target_folder_name,
 			deepl_code,
 			source_lang_id,
 			source_lang_deepl,
 			localization_translator,
-			gemini_localization_system_prompt
+			gemini_localization_system_prompt,
+			translation_cache
 		)
 		with open(target_filepath, 'w', encoding='utf-8-sig') as f:
-			f.writelines(new_lines)
+			# Join once; writelines would push each line through the encoder.
+			f.write("".join(new_lines))
 		return
 
+	# Single pass over the file: collect lines, build the key index, and
+	# check the header while reading instead of re-scanning the list twice.
+	target_lines = []
+	target_index = {}
+	header_needs_update = False
+	header_seen = False
 	with open(target_filepath, 'r', encoding='utf-8-sig') as f:
-		target_lines = f.readlines()
+		for line in f:
+			target_lines.append(line)
+			if not header_seen:
+				stripped = line.strip()
+				if HEADER_RE.match(stripped):
+					header_seen = True
+					header_needs_update = stripped != f"{new_lang_id}:"
+			if ':' in line and '"' in line:
+				match = KEY_VALUE_RE.match(line)
+				if match:
+					target_index[match.group(2)] = len(target_lines) - 1
 
-	target_index = build_target_key_index(target_lines)
 	source_keys = {entry["key"] for entry in source_entries}
 	has_missing_keys = any(entry["key"] not in target_index for entry in source_entries)
 	has_removed_keys = any(key not in source_keys for key in target_index)
-	header_needs_update = False
-	for line in target_lines:
-		if HEADER_RE.match(line.strip()):
-			header_needs_update = line.strip() != f"{new_lang_id}:"
-			break
 
 	# Skip work if nothing changed and the header matches.
 	if not changed_keys and not has_missing_keys and not has_removed_keys and not header_needs_update:
@@ -877,21 +1042,25 @@ def process_file(
 		if removed_count:
 			file_changed = True
 			print(f"  Removed {removed_count} obsolete keys from {filename} -> {target_folder_name}.")
+			# Pruning shifts line numbers, so the index must be rebuilt.
+			target_index = build_target_key_index(target_lines)
 	file_changed = update_target_lines(
 		translator,
 		target_lines,
+		target_index,
 		source_entries,
 		changed_keys,
 		deepl_code,
 		source_lang_deepl,
 		target_folder_name,
 		localization_translator,
-		gemini_localization_system_prompt
+		gemini_localization_system_prompt,
+		translation_cache
 	) or file_changed
 
 	if file_changed:
 		with open(target_filepath, 'w', encoding='utf-8-sig') as f:
-			f.writelines(target_lines)
+			f.write("".join(target_lines))
 	else:
 		print(f"No output changes for {filename} -> {target_folder_name}.")
 
@@ -1057,13 +1226,57 @@ def translate_workshop_description(translator, text, deepl_code, source_lang_dee
 		print(f"  [Error] Failed to translate workshop description to {deepl_code}: {e}")
 		return None
 
+@functools.lru_cache(maxsize=64)
 def _build_gemini_system_prompt(template, target_language):
-	"""Fill the {target_language} placeholder in the system prompt."""
+	"""
+	Fill the {target_language} placeholder in the system prompt.
+
+	Cached: each (template, language) pair is reused for every key sent to
+	Gemini in a run.
+	"""
 	try:
 		return template.format(target_language=target_language)
 	except Exception:
 		return template
 
+def _retry_delay(attempt, retry_after=None):
+	"""
+	Exponential backoff with jitter, capped at 30s.
+
+	Jitter decorrelates retries across the worker threads so parallel 429s
+	don't re-fire in lockstep; a server-provided Retry-After wins when it
+	asks for longer.
+	"""
+	delay = min(30, 2 * (2 ** (attempt - 1)) * (1 + random.uniform(0, 0.5)))
+	if retry_after:
+		try:
+			delay = max(delay, min(30, float(retry_after)))
+		except ValueError:
+			pass
+	return delay
+
+# Per-thread keep-alive connections to the Gemini host. Reusing the TLS
+# session saves a TCP+TLS handshake on every call after the first; thread
+# locals avoid sharing one http.client connection across the worker pool.
+_gemini_threadlocal = threading.local()
+
+def _gemini_post(path, body):
+	"""POST over this thread's keep-alive connection; returns (status, headers, raw bytes)."""
+	conn = getattr(_gemini_threadlocal, "conn", None)
+	if conn is None:
+		conn = http.client.HTTPSConnection(GEMINI_API_HOST, timeout=60)
+		_gemini_threadlocal.conn = conn
+	try:
+		conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+		response = conn.getresponse()
+		return response.status, response.headers, response.read()
+	except Exception:
+		# A stale keep-alive connection fails on reuse; drop it so the
+		# retry loop reconnects fresh.
+		conn.close()
+		_gemini_threadlocal.conn = None
+		raise
+
 def _gemini_generate_content(payload):
 	"""Call the Gemini generateContent API with retries."""
 	if not GEMINI_API_KEY:
@@ -1071,53 +1284,38 @@ def _gemini_generate_content(payload):
 		print("Please create a .env file with GEMINI_API_KEY=your_key_here")
 		return None
 
-	url = f"{GEMINI_API_BASE}/{GEMINI_MODEL}:generateContent"
 	query = urllib.parse.urlencode({"key": GEMINI_API_KEY})
+	path = f"{GEMINI_API_PATH}/{GEMINI_MODEL}:generateContent?{query}"
 	request_body = json.dumps(payload).encode("utf-8")
 
 	max_attempts = 3
-	base_delay = 2
 
-	# Retry transient failures with exponential backoff.
+	# Retry transient failures with jittered exponential backoff.
 	for attempt in range(1, max_attempts + 1):
-		request = urllib.request.Request(
-			f"{url}?{query}",
-			data=request_body,
-			headers={"Content-Type": "application/json"},
-			method="POST"
-		)
-
 		try:
-			with urllib.request.urlopen(request, timeout=60) as response:
-				raw = response.read().decode("utf-8")
-			return json.loads(raw)
-		except urllib.error.HTTPError as e:
-			body = e.read().decode("utf-8", errors="ignore")
-			retryable = e.code in (429, 500, 502, 503, 504)
-			if retryable and attempt < max_attempts:
-				delay = base_delay * (2 ** (attempt - 1))
-				print(f"  [Warning] Gemini API request failed ({e.code}) on attempt {attempt}/{max_attempts}. Retrying in {delay}s...")
-				time.sleep(delay)
-				continue
-			print(f"  [Error] Gemini API request failed ({e.code}): {body}")
-			return None
-		except urllib.error.URLError as e:
-			if attempt < max_attempts:
-				delay = base_delay * (2 ** (attempt - 1))
-				print(f"  [Warning] Gemini API request failed ({e.reason}) on attempt {attempt}/{max_attempts}. Retrying in {delay}s...")
-				time.sleep(delay)
-				continue
-			print(f"  [Error] Gemini API request failed: {e}")
-			return None
+			status, headers, raw = _gemini_post(path, request_body)
 		except Exception as e:
 			if attempt < max_attempts:
-				delay = base_delay * (2 ** (attempt - 1))
-				print(f"  [Warning] Gemini API request failed ({e}) on attempt {attempt}/{max_attempts}. Retrying in {delay}s...")
+				delay = _retry_delay(attempt)
+				print(f"  [Warning] Gemini API request failed ({e}) on attempt {attempt}/{max_attempts}. Retrying in {delay:.1f}s...")
 				time.sleep(delay)
 				continue
 			print(f"  [Error] Gemini API request failed: {e}")
 			return None
 
+		if status == 200:
+			return json.loads(raw.decode("utf-8"))
+
+		body = raw.decode("utf-8", errors="ignore")
+		retryable = status in (429, 500, 502, 503, 504)
+		if retryable and attempt < max_attempts:
+			delay = _retry_delay(attempt, headers.get("Retry-After"))
+			print(f"  [Warning] Gemini API request failed ({status}) on attempt {attempt}/{max_attempts}. Retrying in {delay:.1f}s...")
+			time.sleep(delay)
+			continue
+		print(f"  [Error] Gemini API request failed ({status}): {body}")
+		return None
+
 def _gemini_extract_text(response):
 	"""Extract concatenated text from a Gemini response payload."""
 	candidates = response.get("candidates") if isinstance(response, dict) else None
@@ -1199,75 +1397,109 @@ def translate_workshop_assets(
 	title_success = True
 	cache_changed = False
 
-	for folder_name, deepl_code in TARGET_LANGUAGES.items():
-		if folder_name == source_language:
-			continue
-
-		translation_path = os.path.join(
-			WORKSHOP_TRANSLATIONS_DIR,
-			WORKSHOP_TRANSLATION_FILENAME.format(lang=folder_name)
-		)
-		file_changed = False
-		cache_entry = translation_cache.setdefault(folder_name, {})
-		cached_title = cache_entry.get("title")
-		cached_description = cache_entry.get("description")
+	targets = [
+		(folder_name, deepl_code)
+		for folder_name, deepl_code in TARGET_LANGUAGES.items()
+		if folder_name != source_language
+	]
+
+	def _translate_language(folder_name, deepl_code):
+		"""
+		Network-only phase for one language. Returns a result dict; the
+		caller applies it to the cache and writes files serially.
+		"""
+		cache_entry = translation_cache.get(folder_name, {})
+		target_language = LANGUAGE_DISPLAY_NAMES.get(folder_name, folder_name)
+		result = {
+			"folder_name": folder_name,
+			"title": None,
+			"title_attempted": False,
+			"description": None,
+			"description_attempted": False
+		}
 
 		if title:
-			if cached_title is None or title_translator_changed:
+			if cache_entry.get("title") is None or title_translator_changed:
+				result["title_attempted"] = True
 				provider_label = "gemini-3-flash" if workshop_title_translator == "gemini-3-flash" else "deepl"
 				print(f"Translating workshop title -> {folder_name} ({provider_label})...")
 				if workshop_title_translator == "gemini-3-flash":
-					target_language = LANGUAGE_DISPLAY_NAMES.get(folder_name, folder_name)
-					translated_title = translate_workshop_title_gemini(
+					result["title"] = translate_workshop_title_gemini(
 						title,
 						target_language,
 						gemini_title_system_prompt
 					)
 				else:
-					translated_title = translate_workshop_title(
+					result["title"] = translate_workshop_title(
 						translator,
 						title,
 						deepl_code,
 						source_lang_deepl
 					)
-				if translated_title is not None:
-					cached_title = translated_title
-					cache_entry["title"] = translated_title
-					cache_changed = True
-					file_changed = True
-				else:
-					title_success = False
 			else:
 				print(f"Workshop title cached -> {folder_name}; skipping.")
 
 		if description is not None:
-			needs_description = description_changed or cached_description is None
-			if needs_description:
+			if description_changed or cache_entry.get("description") is None:
+				result["description_attempted"] = True
 				provider_label = "gemini-3-flash" if workshop_description_translator == "gemini-3-flash" else "deepl"
 				print(f"Translating workshop description -> {folder_name} ({provider_label})...")
 				if workshop_description_translator == "gemini-3-flash":
-					target_language = LANGUAGE_DISPLAY_NAMES.get(folder_name, folder_name)
-					translated_description = translate_workshop_description_gemini(
+					result["description"] = translate_workshop_description_gemini(
 						description,
 						target_language,
 						gemini_description_system_prompt
 					)
 				else:
-					translated_description = translate_workshop_description(
+					result["description"] = translate_workshop_description(
 						translator,
 						description,
 						deepl_code,
 						source_lang_deepl
 					)
-				if translated_description is None:
-					description_success = False
-					continue
-				cached_description = translated_description
-				cache_entry["description"] = translated_description
+			else:
+				print(f"Workshop description unchanged -> {folder_name}; skipping.")
+
+		return result
+
+	# Fan the per-language HTTP calls out on a pool so the phase costs the
+	# slowest language, then apply cache/file mutations on this thread only.
+	results = []
+	if targets:
+		with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+			futures = [
+				executor.submit(_translate_language, folder_name, deepl_code)
+				for folder_name, deepl_code in targets
+			]
+			results = [future.result() for future in futures]
+
+	for result in results:
+		folder_name = result["folder_name"]
+		translation_path = os.path.join(
+			WORKSHOP_TRANSLATIONS_DIR,
+			WORKSHOP_TRANSLATION_FILENAME.format(lang=folder_name)
+		)
+		file_changed = False
+		cache_entry = translation_cache.setdefault(folder_name, {})
+
+		if result["title_attempted"]:
+			if result["title"] is not None:
+				cache_entry["title"] = result["title"]
 				cache_changed = True
 				file_changed = True
 			else:
-				print(f"Workshop description unchanged -> {folder_name}; skipping.")
+				title_success = False
+
+		if result["description_attempted"]:
+			if result["description"] is None:
+				description_success = False
+				continue
+			cache_entry["description"] = result["description"]
+			cache_changed = True
+			file_changed = True
+
+		cached_title = cache_entry.get("title")
+		cached_description = cache_entry.get("description")
 
 		if file_changed or template_changed or not os.path.exists(translation_path):
 			if cached_title is None and cached_description is None:
@@ -1283,6 +1515,14 @@ def translate_workshop_assets(
 				translated_language,
 				original_language
 			)
+			# Skip byte-identical rewrites so no-op runs (e.g. a template
+			# comment tweak that renders the same) don't churn mtimes.
+			try:
+				with open(translation_path, "r", encoding="utf-8") as f:
+					if f.read() == output:
+						continue
+			except FileNotFoundError:
+				pass
 			with open(translation_path, "w", encoding="utf-8") as f:
 				f.write(output)
 
@@ -1301,6 +1541,22 @@ def translate_workshop_assets(
 
 	return cache_changed
 
+def _iter_yml_files(dirpath):
+	"""
+	Yield .yml file paths under dirpath, skipping hidden entries.
+
+	Uses os.scandir directly so the cached DirEntry type answers the
+	file/dir question without an extra stat call per entry.
+	"""
+	with os.scandir(dirpath) as entries:
+		for entry in entries:
+			if entry.name.startswith("."):
+				continue
+			if entry.is_dir(follow_symlinks=False):
+				yield from _iter_yml_files(entry.path)
+			elif entry.name.endswith(".yml") and entry.is_file(follow_symlinks=False):
+				yield entry.path
+
 def main():
 	"""Script entry point."""
 	translator = get_translator()
@@ -1330,55 +1586,82 @@ def main():
 		print(f"Error: Source directory not found: {source_dir}")
 		return
 
+	# Filter the source language out once; the per-file loops iterate targets only.
+	targets = [
+		(folder_name, deepl_code)
+		for folder_name, deepl_code in TARGET_LANGUAGES.items()
+		if folder_name != source_language
+	]
+
+	# Create each target folder once upfront instead of per file per language.
+	target_dirs = {}
+	for folder_name, _ in targets:
+		target_dir = os.path.join(BASE_LOC_PATH, folder_name)
+		os.makedirs(target_dir, exist_ok=True)
+		target_dirs[folder_name] = target_dir
+
 	# Load existing hash cache to identify changed keys.
 	hash_data = load_hashes(HASHES_PATH)
 	hashes_modified = False
 	processed_files = set()
 
-	for root, _, files in os.walk(source_dir):
-		for file in files:
-			if file.endswith(".yml"):
-				source_filepath = os.path.join(root, file)
-				with open(source_filepath, 'r', encoding='utf-8-sig') as f:
-					source_lines = f.readlines()
-
-				# Build per-key hashes from the source file.
-				source_entries = parse_source_entries(source_lines)
-				source_hashes = {}
-				for entry in source_entries:
-					source_hashes[entry["key"]] = hash_text(entry["value"])
-
-				source_rel_path = os.path.relpath(source_filepath, BASE_LOC_PATH)
-				processed_files.add(source_rel_path)
-
-				# Determine which keys changed since last run.
-				prev_hashes = hash_data["files"].get(source_rel_path, {})
-				changed_keys = set()
-				for key, current_hash in source_hashes.items():
-					if prev_hashes.get(key) != current_hash:
-						changed_keys.add(key)
-
-				for folder_name, deepl_code in TARGET_LANGUAGES.items():
-					if folder_name == source_language:
-						continue
-					process_file(
-						translator,
-						source_lines,
-						source_entries,
-						source_filepath,
-						folder_name,
-						deepl_code,
-						source_lang_id,
-						source_lang_deepl,
-						changed_keys,
-						localization_translator,
-						gemini_localization_system_prompt
-					)
-
-				# Persist updated hashes for this file.
-				if prev_hashes != source_hashes:
-					hash_data["files"][source_rel_path] = source_hashes
-					hashes_modified = True
+	# Memoized translations keyed by source hash then target code. Entries
+	# are only ever added, so a grown count means the cache needs saving.
+	translation_cache = hash_data.setdefault("translations", {})
+	cached_translation_count = sum(len(langs) for langs in translation_cache.values())
+
+	for source_filepath in _iter_yml_files(source_dir):
+		with open(source_filepath, 'r', encoding='utf-8-sig') as f:
+			# One read + one C-level split instead of a line-at-a-time loop.
+			source_lines = f.read().splitlines(keepends=True)
+
+		# Build per-key hashes from the source file.
+		source_entries = parse_source_entries(source_lines)
+		source_hashes = {}
+		for entry in source_entries:
+			source_hashes[entry["key"]] = hash_text(entry["value"])
+
+		source_rel_path = os.path.relpath(source_filepath, BASE_LOC_PATH)
+		processed_files.add(source_rel_path)
+
+		# Determine which keys changed since last run.
+		prev_hashes = hash_data["files"].get(source_rel_path, {})
+		changed_keys = set()
+		for key, current_hash in source_hashes.items():
+			if prev_hashes.get(key) != current_hash:
+				changed_keys.add(key)
+
+		# Each target language is independent, network-bound work on its
+		# own output file; run them concurrently so wall time tracks the
+		# slowest language instead of the sum of all of them.
+		with ThreadPoolExecutor(max_workers=len(TARGET_LANGUAGES)) as executor:
+			futures = [
+				executor.submit(
+					process_file,
+					translator,
+					source_lines,
+					source_entries,
+					source_filepath,
+					folder_name,
+					target_dirs[folder_name],
+					deepl_code,
+					source_lang_id,
+					source_lang_deepl,
+					changed_keys,
+					localization_translator,
+					gemini_localization_system_prompt,
+					translation_cache
+				)
+				for folder_name, deepl_code in targets
+			]
+			for future in futures:
+				future.result()
+
+		# Persist updated hashes for this file. changed_keys already covers
+		# added and edited keys, so only deletions need the key-set check.
+		if changed_keys or prev_hashes.keys() != source_hashes.keys():
+			hash_data["files"][source_rel_path] = source_hashes
+			hashes_modified = True
 
 	# Drop cache entries for source files that no longer exist.
 	for rel_path in list(hash_data["files"].keys()):
@@ -1386,6 +1669,9 @@ def main():
 			del hash_data["files"][rel_path]
 			hashes_modified = True
 
+	if sum(len(langs) for langs in translation_cache.values()) != cached_translation_count:
+		hashes_modified = True
+
 	# Optionally translate workshop title/description.
 	if translate_workshop:
 		hashes_modified = translate_workshop_assets(
@@ -1,28 +1,38 @@
+import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+import time
 
 import tomllib
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEPENDENCIES_DIR = os.path.join(SCRIPT_DIR, "dependencies")
 # Allow importing the bundled steamworks module from scripts/dependencies/steamworks.
+# The import itself happens in main() after config validation: loading the
+# native Steamworks DLL is the slowest part of startup and is wasted when
+# the script exits early on a bad config.
 sys.path.insert(0, DEPENDENCIES_DIR)
 
-from steamworks import STEAMWORKS
-
 ROOT_DIR = os.path.dirname(SCRIPT_DIR)
 
 # Paths & Configs
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config.toml")
 METADATA_PATH = os.path.join(ROOT_DIR, ".metadata", "metadata.json")
+UPLOAD_CACHE_PATH = os.path.join(ROOT_DIR, ".metadata", ".workshop_upload_cache.json")
 WORKSHOP_DESCRIPTION_PATH = os.path.join(ROOT_DIR, "assets", "workshop", "workshop-description.txt")
 TRANSLATIONS_DIR = os.path.join(ROOT_DIR, "assets", "workshop", "translations")
 APP_ID = 3450310
+SUBMIT_TIMEOUT_SECONDS = 30
+SUBMIT_POLL_INTERVAL_SECONDS = 0.02
 WORKSHOP_TRANSLATION_FILENAME_RE = re.compile(r"^workshop_(.+)\.txt$")
 WORKSHOP_TITLE_MARKER = "===WORKSHOP_TITLE==="
 WORKSHOP_DESCRIPTION_MARKER = "===WORKSHOP_DESCRIPTION==="
+# Matches a marker on its own line (surrounding horizontal whitespace and the
+# line break included) so one split replaces the per-line scanner.
+WORKSHOP_MARKER_RE = re.compile(r'(?m)^[^\S\n]*===WORKSHOP_(TITLE|DESCRIPTION)===[^\S\n]*(?:\n|\Z)')
 WORKSHOP_NO_TRANSLATE_BELOW = "--NO-TRANSLATE-BELOW--"
 WORKSHOP_ITEM_ID_TOKEN = "$item-id$"
 MAX_DESCRIPTION_LENGTH = 8000
@@ -82,8 +92,12 @@ def load_config(config_path):
 def read_text(path):
 	"""Read a UTF-8 text file, returning None on missing/failed reads."""
 	try:
-		with open(path, "r", encoding="utf-8-sig") as f:
-			return f.read()
+		# Binary read pulls the whole file in one request; decoding after
+		# skips the incremental-decoder text layer. The replace keeps the
+		# universal-newline normalization text mode used to do, so CRLF
+		# files produce the same payload bytes as before.
+		with open(path, "rb") as f:
+			return f.read().decode("utf-8-sig").replace("\r\n", "\n")
 	except FileNotFoundError:
 		return None
 	except Exception as e:
@@ -93,8 +107,8 @@ def read_text(path):
 def load_mod_title(metadata_path):
 	"""Load and sanitize the workshop title from metadata.json."""
 	try:
-		with open(metadata_path, "r", encoding="utf-8-sig") as f:
-			data = json.load(f)
+		with open(metadata_path, "rb") as f:
+			data = json.loads(f.read().decode("utf-8-sig"))
 	except FileNotFoundError:
 		print(f"Warning: Metadata file not found: {metadata_path}")
 		return None
@@ -124,37 +138,51 @@ def _parse_int(value, label):
 		return None
 	return parsed
 
+def _hash_payload(text):
+	"""Hash an upload payload for change detection; None stays None."""
+	if text is None:
+		return None
+	return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def load_upload_cache(path):
+	"""Load the per-language upload hash cache; missing or invalid means empty."""
+	try:
+		with open(path, "rb") as f:
+			data = json.load(f)
+	except FileNotFoundError:
+		return {}
+	except Exception as e:
+		print(f"Warning: Failed to read upload cache '{path}': {e}")
+		return {}
+	return data if isinstance(data, dict) else {}
+
+def save_upload_cache(path, data):
+	"""Atomically persist the upload hash cache."""
+	tmp_path = path + ".tmp"
+	try:
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			f.write(json.dumps(data, separators=(",", ":")))
+		os.replace(tmp_path, path)
+	except Exception as e:
+		print(f"Warning: Failed to write upload cache '{path}': {e}")
+
 def parse_workshop_translation(text):
 	"""Extract title/description sections from a combined workshop translation file."""
 	title = None
 	description = None
-	current = None
-	buffer = []
 
-	def flush():
-		nonlocal title, description, buffer, current
-		content = "".join(buffer)
-		if current == "title":
+	# One C-level split on the marker lines; parts alternate between the
+	# captured marker kind and the section content that follows it.
+	parts = WORKSHOP_MARKER_RE.split(text)
+	for i in range(1, len(parts), 2):
+		kind = parts[i]
+		content = parts[i + 1] if i + 1 < len(parts) else ""
+		if kind == "TITLE":
 			cleaned = content.strip()
 			title = cleaned if cleaned else None
-		elif current == "description":
+		else:
 			description = content
-		buffer = []
-
-	for line in text.splitlines(keepends=True):
-		stripped = line.strip()
-		if stripped == WORKSHOP_TITLE_MARKER:
-			flush()
-			current = "title"
-			continue
-		if stripped == WORKSHOP_DESCRIPTION_MARKER:
-			flush()
-			current = "description"
-			continue
-		if current:
-			buffer.append(line)
 
-	flush()
 	return title, description
 
 def split_workshop_description(text):
@@ -198,10 +226,13 @@ def build_language_updates(source_language, item_id):
 	base_description = _trim_description(base_description, source_language)
 	base_title = load_mod_title(METADATA_PATH)
 
-	# Always include the source-language title/description.
+	# Always include the source-language title/description. The encoded
+	# Steam language is precomputed so the upload loop passes bytes straight
+	# to the native layer.
 	updates = [{
 		"lang": source_language,
 		"steam_lang": LANGUAGE_TO_STEAM[source_language],
+		"steam_lang_bytes": LANGUAGE_TO_STEAM[source_language].encode("ascii"),
 		"title": base_title,
 		"description": base_description
 	}]
@@ -210,15 +241,19 @@ def build_language_updates(source_language, item_id):
 		print(f"Warning: Translations folder not found: {TRANSLATIONS_DIR}")
 		return updates
 
-	# Collect any translated workshop files that exist on disk.
+	# Collect any translated workshop files that exist on disk. scandir
+	# hands back entry paths directly, skipping the per-name join + stat.
 	translations = {}
-	for filename in os.listdir(TRANSLATIONS_DIR):
-		match = WORKSHOP_TRANSLATION_FILENAME_RE.match(filename)
+	for entry in os.scandir(TRANSLATIONS_DIR):
+		name = entry.name
+		# Two C-level string checks reject unrelated files before the regex.
+		if not (name.startswith("workshop_") and name.endswith(".txt")):
+			continue
+		match = WORKSHOP_TRANSLATION_FILENAME_RE.match(name)
 		if not match:
 			continue
 		lang = match.group(1)
-		path = os.path.join(TRANSLATIONS_DIR, filename)
-		text = read_text(path)
+		text = read_text(entry.path)
 		if text is None:
 			continue
 		title_text, desc_text = parse_workshop_translation(text)
@@ -239,14 +274,43 @@ def build_language_updates(source_language, item_id):
 		updates.append({
 			"lang": lang,
 			"steam_lang": LANGUAGE_TO_STEAM[lang],
+			"steam_lang_bytes": LANGUAGE_TO_STEAM[lang].encode("ascii"),
 			"title": entry["title"],
 			"description": entry["description"]
 		})
 
 	return updates
 
+def parse_args():
+	parser = argparse.ArgumentParser(description="Upload Workshop titles/descriptions for all languages.")
+	parser.add_argument(
+		"--force",
+		action="store_true",
+		help="Upload every language even when the cached payload is unchanged."
+	)
+	return parser.parse_args()
+
+def _await_submit_result(steam, results, expected, lang_label):
+	"""Drain callbacks until the pending submit's result arrives.
+
+	Returns the result struct, or None on timeout. The native SDK keeps one
+	call-result registration per call type, so each submit must be confirmed
+	before the next one is issued.
+	"""
+	start = time.monotonic()
+	while len(results) < expected:
+		steam.run_callbacks()
+		if len(results) >= expected:
+			break
+		if time.monotonic() - start > SUBMIT_TIMEOUT_SECONDS:
+			print(f"Error: Timed out waiting for the Workshop submit result for {lang_label}.")
+			return None
+		time.sleep(SUBMIT_POLL_INTERVAL_SECONDS)
+	return results[-1]
+
 def main():
 	"""Upload workshop titles/descriptions for all available languages."""
+	args = parse_args()
 	(
 		source_language,
 		item_id
@@ -259,57 +323,111 @@ def main():
 	if updates is None:
 		return 1
 
-	print("Workshop language updates:")
+	# Skip languages whose payload matches the last successful upload; the
+	# Workshop round-trips are the slow part and re-sending identical
+	# content is a no-op server-side.
+	upload_cache = load_upload_cache(UPLOAD_CACHE_PATH)
+	pending = []
 	for update in updates:
-		print(
-			f"  - {update['lang']} ({update['steam_lang']}): "
-			f"{'title' if update['title'] is not None else 'no-title'}, "
-			f"{'description' if update['description'] is not None else 'no-description'}"
-		)
+		payload = {
+			"item_id": item_id,
+			"title": _hash_payload(update["title"]),
+			"description": _hash_payload(update["description"])
+		}
+		if not args.force and upload_cache.get(update["lang"]) == payload:
+			print(f"Workshop page unchanged -> {update['lang']}; skipping.")
+			continue
+		pending.append((update, payload))
+
+	if not pending:
+		print("All workshop pages up to date; nothing to upload.")
+		return 0
+	updates = [update for update, _ in pending]
+
+	# Build the summary once and emit a single write instead of one print
+	# (and one stdout flush on unbuffered terminals) per language.
+	summary_lines = ["Workshop language updates:"]
+	summary_lines.extend(
+		f"  - {update['lang']} ({update['steam_lang']}): "
+		f"{'title' if update['title'] is not None else 'no-title'}, "
+		f"{'description' if update['description'] is not None else 'no-description'}"
+		for update in updates
+	)
+	print("\n".join(summary_lines))
 
 	cwd_before = os.getcwd()
 	try:
 		# SteamworksPy resolves DLL/appid from the current working directory.
 		os.chdir(DEPENDENCIES_DIR)
 		# Load the native Steamworks wrapper.
+		from steamworks import STEAMWORKS
+		from steamworks.enums import EResult
+
 		steam = STEAMWORKS()
 
 		steam.initialize()
 
-		# Use the Workshop interface for the update flow.
+		# Use the Workshop interface for the update flow. Bind the methods
+		# once; each loop iteration then calls a local instead of repeating
+		# the attribute lookups.
 		workshop = steam.Workshop
-
-		for update in updates:
-			handle = workshop.StartItemUpdate(APP_ID, item_id)
+		start_item_update = workshop.StartItemUpdate
+		set_item_update_language = steam.Workshop_SetItemUpdateLanguage
+		set_item_title = workshop.SetItemTitle
+		set_item_description = workshop.SetItemDescription
+		submit_item_update = workshop.SubmitItemUpdate
+
+		submit_results = []
+		success = True
+		for update, payload in pending:
+			handle = start_item_update(APP_ID, item_id)
 			if not handle:
 				print("Error: StartItemUpdate failed. Check app ID and item ID.")
 				return 1
 
 			# Set the Workshop update language.
 			lang_label = f"{update['lang']} ({update['steam_lang']})"
-			lang_result = steam.Workshop_SetItemUpdateLanguage(handle, update["steam_lang"].encode())
+			lang_result = set_item_update_language(handle, update["steam_lang_bytes"])
 			if lang_result is False:
 				print(f"Error: SetItemUpdateLanguage failed for {lang_label}.")
 				return 1
 
 			if update["title"] is not None:
 				# Title is optional per language.
-				title_result = workshop.SetItemTitle(handle, update["title"])
+				title_result = set_item_title(handle, update["title"])
 				if title_result is False:
 					print(f"Error: SetItemTitle failed for {lang_label}.")
 					return 1
 
 			if update["description"] is not None:
 				# Description is optional per language.
-				desc_result = workshop.SetItemDescription(handle, update["description"])
+				desc_result = set_item_description(handle, update["description"])
 				if desc_result is False:
 					print(f"Error: SetItemDescription failed for {lang_label}.")
 					return 1
 
-			# Just using an empty change note.
-			workshop.SubmitItemUpdate(handle, "")
-
-		print("Workshop updates submitted. Check Steam client for upload progress.")
+			# Just using an empty change note. The submit is asynchronous, so
+			# confirm its result before caching the payload: a rejected submit
+			# must stay uncached so the next run retries it.
+			expected = len(submit_results) + 1
+			submit_item_update(handle, "", callback=submit_results.append, override_callback=True)
+			result = _await_submit_result(steam, submit_results, expected, lang_label)
+			if result is None:
+				success = False
+				continue
+			if result.result != EResult.OK.value:
+				print(f"Error: Workshop submit failed for {lang_label} with result code {result.result}.")
+				success = False
+				continue
+			if result.userNeedsToAcceptWorkshopLegalAgreement:
+				print("Warning: You must accept the Workshop legal agreement in Steam before the update is visible.")
+			upload_cache[update["lang"]] = payload
+
+		save_upload_cache(UPLOAD_CACHE_PATH, upload_cache)
+		if not success:
+			print("Some Workshop updates failed; those languages were left uncached and will retry next run.")
+			return 1
+		print("Workshop updates submitted and confirmed.")
 		return 0
 	finally:
 		# Always restore cwd.
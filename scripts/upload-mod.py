@@ -1,22 +1,20 @@
 import argparse
+import functools
 import json
 import os
 import re
 import shutil
 import stat
+import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 import tomllib
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEPENDENCIES_DIR = os.path.join(SCRIPT_DIR, "dependencies")
-# Allow importing the bundled steamworks module from scripts/dependencies/steamworks.
-sys.path.insert(0, DEPENDENCIES_DIR)
-
-from steamworks import STEAMWORKS
-from steamworks.enums import EResult, EWorkshopFileType
 
 # --- User Configuration ---
 SOURCES = [
@@ -29,15 +27,46 @@ SOURCES = [
 # --- Path Setup ---
 ROOT_DIR = os.path.dirname(SCRIPT_DIR)
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config.toml")
+SRC_META_DIR = os.path.join(ROOT_DIR, ".metadata")
+DEV_META_PATH = os.path.join(SRC_META_DIR, "metadata.json")
+THUMB_RELEASE_PATH = os.path.join(SRC_META_DIR, "thumbnail-release.png")
+THUMB_STD_PATH = os.path.join(SRC_META_DIR, "thumbnail.png")
 APP_ID = 3450310
 CREATE_ITEM_TIMEOUT_SECONDS = 30
-CREATE_ITEM_POLL_INTERVAL_SECONDS = 0.1
+# Callbacks are dispatched synchronously by run_callbacks, so the poll
+# interval is the latency floor on item creation. Creation usually
+# completes within tens of ms, so poll at 2 ms while the call is fresh,
+# then back off to 20 ms for the long tail.
+CREATE_ITEM_POLL_FAST_SECONDS = 0.002
+CREATE_ITEM_POLL_FAST_WINDOW_SECONDS = 0.1
+CREATE_ITEM_POLL_SLOW_SECONDS = 0.02
 POST_UPLOAD_DELAY_SECONDS = 3
 CLEANUP_RETRY_DELAY_SECONDS = 3
 CLEANUP_MAX_ATTEMPTS = 20
-WORKSHOP_FILE_TYPE = EWorkshopFileType.COMMUNITY
 SUBMODS_DIR_NAME = "submods"
 
+# Populated by _load_steamworks on first use. Loading the bundled SDK pulls
+# in a native DLL, so --help and config-error exits shouldn't pay for it.
+STEAMWORKS = None
+EResult = None
+WORKSHOP_FILE_TYPE = None
+_ERESULT_BY_VALUE = {}
+
+def _load_steamworks():
+    global STEAMWORKS, EResult, WORKSHOP_FILE_TYPE, _ERESULT_BY_VALUE
+    if STEAMWORKS is not None:
+        return
+    # Allow importing the bundled steamworks module from scripts/dependencies/steamworks.
+    sys.path.insert(0, DEPENDENCIES_DIR)
+    from steamworks import STEAMWORKS as _STEAMWORKS
+    from steamworks.enums import EResult as _EResult, EWorkshopFileType
+    STEAMWORKS = _STEAMWORKS
+    EResult = _EResult
+    WORKSHOP_FILE_TYPE = EWorkshopFileType.COMMUNITY
+    # Value -> member table so unknown result codes are a dict miss instead
+    # of an exception raised out of the EResult constructor.
+    _ERESULT_BY_VALUE = {member.value: member for member in _EResult}
+
 def _on_rm_error(func, path, exc_info):
     exc = exc_info[1]
     winerror = getattr(exc, "winerror", None)
@@ -47,6 +76,31 @@ def _on_rm_error(func, path, exc_info):
     os.chmod(path, stat.S_IWRITE)
     func(path)
 
+def _fast_copytree(src, dst):
+    """Copy a directory tree, merging into an existing destination.
+
+    On Windows this shells out to robocopy, which copies with 64 threads and is
+    dramatically faster than shutil.copytree on large trees. Robocopy exit
+    codes below 8 all mean success (0 = nothing copied, 1-7 = files copied
+    and/or extras detected).
+    """
+    if sys.platform == "win32":
+        os.makedirs(dst, exist_ok=True)
+        result = subprocess.run(
+            ["robocopy", src, dst, "/E", "/MT:64", "/NFL", "/NDL", "/NJH", "/NJS", "/R:1", "/W:1"],
+            check=False
+        )
+        if result.returncode >= 8:
+            raise OSError(f"robocopy failed copying '{src}' to '{dst}' (exit code {result.returncode})")
+    else:
+        # copyfile skips copy2's per-file stat/chmod pair; the release tree
+        # only needs file contents, not permissions or timestamps. When the
+        # platform lacks a zero-copy fastpath (sendfile/fcopyfile) and shutil
+        # falls back to read/write loops, a 1 MiB buffer cuts syscalls ~64x
+        # versus the 16 KiB default.
+        shutil.COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, 1 << 20)
+        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=shutil.copyfile)
+
 def _parse_int(value, label, allow_zero=False):
     """Parse a positive integer (or zero when allowed) with a friendly error message."""
     try:
@@ -61,11 +115,32 @@ def _parse_int(value, label, allow_zero=False):
         return None
     return parsed
 
+# Parsed-config cache keyed by the file's stat signature, so repeat
+# load_config calls (and re-reads after our own rewrites) skip the
+# tomllib parse. Rewrites below refresh the entry with the post-write stat.
+_CONFIG_CACHE = {}
+
+def _config_cache_key(st):
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _refresh_config_cache(config_path, text):
+    try:
+        _CONFIG_CACHE[config_path] = (
+            _config_cache_key(os.stat(config_path)),
+            tomllib.loads(text)
+        )
+    except Exception:
+        _CONFIG_CACHE.pop(config_path, None)
+
 def load_config(config_path):
     """Load config.toml values needed for Workshop uploads."""
     try:
+        st = os.stat(config_path)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == _config_cache_key(st):
+            return cached[1]
         with open(config_path, "rb") as f:
-            data = tomllib.load(f)
+            data = tomllib.loads(f.read().decode("utf-8"))
     except FileNotFoundError:
         print(f"Error: Config file not found: {config_path}")
         return None
@@ -73,6 +148,7 @@ def load_config(config_path):
         print(f"Error reading config file: {e}")
         return None
 
+    _CONFIG_CACHE[config_path] = (_config_cache_key(st), data)
     return data
 
 def load_workshop_item_id(config, key, label):
@@ -92,9 +168,21 @@ def load_dev_name(config):
     dev_name = str(dev_name).strip()
     return dev_name if dev_name else None
 
+# Compiled once per key instead of per line/call; the handful of keys the
+# script touches makes the caches effectively unbounded-safe.
+@functools.lru_cache(maxsize=32)
+def _key_value_re(key):
+    return re.compile(rf"^(\s*{re.escape(key)}\s*=\s*)([^#]*?)(\s*)(#.*)?$")
+
+@functools.lru_cache(maxsize=32)
+def _key_line_re(key):
+    return re.compile(rf"^\s*{re.escape(key)}\s*=[^\n]*$", re.MULTILINE)
+
+_MOD_ID_RE = re.compile(r"^\s*mod_id\s*=\s*(.+?)(\s*#.*)?$")
+_WORKSHOP_ID_RE = re.compile(r"^\s*workshop_id\s*=\s*(.+?)(\s*#.*)?$")
+
 def _replace_value_preserve_comment(line, key, value):
-    pattern = re.compile(rf"^(\s*{re.escape(key)}\s*=\s*)([^#]*?)(\s*)(#.*)?$")
-    match = pattern.match(line)
+    match = _key_value_re(key).match(line)
     if not match:
         return f"{key} = {value}"
     prefix, _old_value, gap, comment = match.groups()
@@ -109,7 +197,7 @@ def update_config_value(config_path, key, value):
     """Update a single key in config.toml while preserving comments."""
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
+            text = f.read()
     except FileNotFoundError:
         print(f"Error: Config file not found: {config_path}")
         return False
@@ -117,27 +205,38 @@ def update_config_value(config_path, key, value):
         print(f"Error reading config file: {e}")
         return False
 
-    updated = False
-    for idx, line in enumerate(lines):
-        if re.match(rf"^\s*{re.escape(key)}\s*=", line):
-            lines[idx] = _replace_value_preserve_comment(line, key, value)
-            updated = True
-            break
+    # One multiline scan replaces the first matching line in place; the
+    # rest of the file is left byte-for-byte untouched.
+    new_text, count = _key_line_re(key).subn(
+        lambda match: _replace_value_preserve_comment(match.group(0), key, value),
+        text,
+        count=1
+    )
+
+    if count == 0:
+        if new_text and not new_text.endswith("\n"):
+            new_text += "\n"
+        new_text += f"{key} = {value}\n"
 
-    if not updated:
-        lines.append(f"{key} = {value}")
+    if new_text == text:
+        return True
 
+    # Atomic swap: a crash mid-write must not corrupt the user's config.
+    tmp_path = config_path + ".tmp"
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(new_text)
+        os.replace(tmp_path, config_path)
     except Exception as e:
         print(f"Error writing config file: {e}")
         return False
 
+    _refresh_config_cache(config_path, new_text)
     return True
 
 @contextmanager
 def steamworks_session():
+    _load_steamworks()
     cwd_before = os.getcwd()
     try:
         os.chdir(DEPENDENCIES_DIR)
@@ -147,32 +246,9 @@ def steamworks_session():
     finally:
         os.chdir(cwd_before)
 
-def create_workshop_item(steam):
-    result_holder = {"done": False, "result": None}
-
-    def on_created(result):
-        result_holder["done"] = True
-        result_holder["result"] = result
-
-    workshop = steam.Workshop
-    workshop.CreateItem(APP_ID, WORKSHOP_FILE_TYPE, callback=on_created)
-
-    start = time.time()
-    while not result_holder["done"]:
-        steam.run_callbacks()
-        time.sleep(CREATE_ITEM_POLL_INTERVAL_SECONDS)
-        if time.time() - start > CREATE_ITEM_TIMEOUT_SECONDS:
-            print("Error: Timed out while waiting for Workshop item creation.")
-            return None
-
-    result = result_holder["result"]
-    if result is None:
-        print("Error: Workshop item creation did not return a result.")
-        return None
-
-    try:
-        result_code = EResult(result.result)
-    except ValueError:
+def _extract_created_item_id(result):
+    result_code = _ERESULT_BY_VALUE.get(result.result)
+    if result_code is None:
         print(f"Error: Workshop item creation failed with unknown result code {result.result}.")
         return None
 
@@ -191,6 +267,56 @@ def create_workshop_item(steam):
     print(f"Created new Workshop item: {new_id}")
     return new_id
 
+def create_workshop_items(steam, count):
+    """Create several Workshop items, one call-result in flight at a time.
+
+    The native SDK keeps a single call-result registration per call type, so
+    a second CreateItem issued before the first result arrives unregisters
+    the pending call and its id is lost (the item still exists server-side).
+    Each call is therefore drained before the next is issued; the two-tier
+    poll keeps the per-item wait near the actual callback latency. The shared
+    callback is registered with override_callback=True, which also evicts any
+    stale callback left in the wrapper's slot by an earlier call. Returns the
+    new item ids; the list is shorter than count if any creation failed or
+    timed out.
+    """
+    results = []
+    workshop = steam.Workshop
+    for expected in range(1, count + 1):
+        workshop.CreateItem(APP_ID, WORKSHOP_FILE_TYPE, callback=results.append, override_callback=True)
+
+        start = time.monotonic()
+        while len(results) < expected:
+            steam.run_callbacks()
+            if len(results) >= expected:
+                break
+            elapsed = time.monotonic() - start
+            if elapsed > CREATE_ITEM_TIMEOUT_SECONDS:
+                print(
+                    "Error: Timed out while waiting for Workshop item creation "
+                    f"({len(results)} of {count} completed)."
+                )
+                break
+            time.sleep(
+                CREATE_ITEM_POLL_FAST_SECONDS
+                if elapsed < CREATE_ITEM_POLL_FAST_WINDOW_SECONDS
+                else CREATE_ITEM_POLL_SLOW_SECONDS
+            )
+
+        if len(results) < expected:
+            break
+
+    new_ids = []
+    for result in results:
+        new_id = _extract_created_item_id(result)
+        if new_id is not None:
+            new_ids.append(new_id)
+    return new_ids
+
+def create_workshop_item(steam):
+    new_ids = create_workshop_items(steam, 1)
+    return new_ids[0] if new_ids else None
+
 def ensure_item_id(steam, item_id, config_path, config_key):
     if item_id != 0:
         return item_id
@@ -271,7 +397,7 @@ def _parse_submod_blocks(lines):
         if current is None:
             continue
 
-        match = re.match(r"^\s*mod_id\s*=\s*(.+?)(\s*#.*)?$", line)
+        match = _MOD_ID_RE.match(line)
         if match:
             value = match.group(1).strip()
             if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
@@ -280,7 +406,7 @@ def _parse_submod_blocks(lines):
             current["mod_id_line"] = idx
             continue
 
-        match = re.match(r"^\s*workshop_id\s*=\s*(.+?)(\s*#.*)?$", line)
+        match = _WORKSHOP_ID_RE.match(line)
         if match:
             current["workshop_id_line"] = idx
             continue
@@ -288,7 +414,11 @@ def _parse_submod_blocks(lines):
     finalize(len(lines) - 1)
     return blocks
 
-def update_submod_entry(config_path, mod_id, workshop_id):
+def flush_submod_updates(config_path, updates):
+    """Apply several submod workshop_id updates in one read/parse/write pass."""
+    if not updates:
+        return True
+
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             lines = f.read().splitlines()
@@ -299,21 +429,29 @@ def update_submod_entry(config_path, mod_id, workshop_id):
         print(f"Error reading config file: {e}")
         return False
 
-    blocks = _parse_submod_blocks(lines)
-    target = None
-    for block in blocks:
-        if block["mod_id"] == mod_id:
-            target = block
-            break
-
-    if target:
-        if target["workshop_id_line"] is not None:
-            idx = target["workshop_id_line"]
+    blocks_by_mod_id = {}
+    for block in _parse_submod_blocks(lines):
+        if block["mod_id"] is not None and block["mod_id"] not in blocks_by_mod_id:
+            blocks_by_mod_id[block["mod_id"]] = block
+
+    insertions = []
+    appends = []
+    for mod_id, workshop_id in updates.items():
+        block = blocks_by_mod_id.get(mod_id)
+        if block is None:
+            appends.append((mod_id, workshop_id))
+        elif block["workshop_id_line"] is not None:
+            idx = block["workshop_id_line"]
             lines[idx] = _replace_value_preserve_comment(lines[idx], "workshop_id", workshop_id)
         else:
-            insert_at = target["mod_id_line"] + 1 if target["mod_id_line"] is not None else target["start"] + 1
-            lines.insert(insert_at, f"workshop_id = {workshop_id}")
-    else:
+            insert_at = block["mod_id_line"] + 1 if block["mod_id_line"] is not None else block["start"] + 1
+            insertions.append((insert_at, f"workshop_id = {workshop_id}"))
+
+    # Apply insertions bottom-up so earlier positions stay valid as lines shift.
+    for insert_at, new_line in sorted(insertions, reverse=True):
+        lines.insert(insert_at, new_line)
+
+    for mod_id, workshop_id in appends:
         if lines and lines[-1].strip():
             lines.append("")
         escaped_mod_id = str(mod_id).replace('"', '\\"')
@@ -321,13 +459,18 @@ def update_submod_entry(config_path, mod_id, workshop_id):
         lines.append(f'mod_id = "{escaped_mod_id}"')
         lines.append(f"workshop_id = {workshop_id}")
 
+    new_text = "\n".join(lines) + "\n"
+    # Atomic swap, same as update_config_value.
+    tmp_path = config_path + ".tmp"
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(new_text)
+        os.replace(tmp_path, config_path)
     except Exception as e:
         print(f"Error writing config file: {e}")
         return False
 
+    _refresh_config_cache(config_path, new_text)
     return True
 
 def load_submods_config(config):
@@ -351,12 +494,14 @@ def load_submods_config(config):
 
 def _load_submod_metadata(mod_dir):
     meta_path = os.path.join(mod_dir, ".metadata", "metadata.json")
-    if not os.path.exists(meta_path):
+    # Open directly instead of an os.path.exists pre-check; the missing-file
+    # case is just one more except arm and costs no extra stat.
+    try:
+        with open(meta_path, "rb") as f:
+            data = json.loads(f.read().decode("utf-8-sig"))
+    except FileNotFoundError:
         print(f"Warning: Missing metadata.json for submod at {mod_dir}.")
         return None
-    try:
-        with open(meta_path, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
     except Exception as e:
         print(f"Warning: Failed to read submod metadata '{meta_path}': {e}")
         return None
@@ -382,25 +527,6 @@ def _load_submod_metadata(mod_dir):
         "thumbnail": os.path.join(mod_dir, ".metadata", "thumbnail.png")
     }
 
-def ensure_submod_item_id(steam, mod_id, workshop_id, config_path):
-    if workshop_id and workshop_id != 0:
-        return workshop_id
-
-    print(f"Submod '{mod_id}' has no Workshop id; creating a new Workshop item...")
-    new_id = create_workshop_item(steam)
-    if new_id is None:
-        return None
-
-    if update_submod_entry(config_path, mod_id, new_id):
-        print(f"Updated submods list in {config_path} for '{mod_id}'.")
-    else:
-        print(
-            f"Warning: Failed to update {config_path}. "
-            f"Please add workshop_id = {new_id} for mod_id = '{mod_id}'."
-        )
-
-    return new_id
-
 def upload_submods(steam, config):
     submods_root = os.path.join(ROOT_DIR, SUBMODS_DIR_NAME)
     if not os.path.isdir(submods_root):
@@ -410,17 +536,23 @@ def upload_submods(steam, config):
     mapping = load_submods_config(config)
     success = True
 
-    entries = sorted(os.listdir(submods_root))
+    # scandir returns entries with the directory bit already cached from the
+    # directory read, so the per-entry isdir check below is stat-free.
+    with os.scandir(submods_root) as it:
+        entries = sorted(it, key=lambda e: e.name)
     if not entries:
         print(f"Warning: No submods found in {submods_root}.")
         return True
 
+    # Gather metadata first so every missing Workshop item can be created in
+    # one callback drain, instead of paying the poll loop once per submod.
+    submods = []
+    need_ids = []
     for entry in entries:
-        mod_dir = os.path.join(submods_root, entry)
-        if not os.path.isdir(mod_dir):
+        if not entry.is_dir(follow_symlinks=False):
             continue
 
-        meta = _load_submod_metadata(mod_dir)
+        meta = _load_submod_metadata(entry.path)
         if meta is None:
             success = False
             continue
@@ -432,22 +564,51 @@ def upload_submods(steam, config):
             success = False
             continue
 
-        workshop_id = ensure_submod_item_id(steam, mod_id, workshop_id, CONFIG_PATH)
-        if workshop_id is None:
-            success = False
-            continue
-        mapping[mod_id] = workshop_id
-
-        title = meta["name"]
-        if title is None:
-            print(f"Warning: Submod '{mod_id}' has no name; Workshop title will not be updated.")
-
-        preview_path = meta["thumbnail"]
-        if not os.path.exists(preview_path):
-            preview_path = None
+        submods.append((meta, workshop_id))
+        if workshop_id == 0:
+            need_ids.append(mod_id)
 
-        if not upload_release(steam.Workshop, meta["root"], preview_path, workshop_id, title):
-            success = False
+    # New Workshop ids are written to config.toml in one pass after the
+    # uploads; the finally still persists them if an upload raises mid-run.
+    pending = {}
+    try:
+        if need_ids:
+            print(f"Creating {len(need_ids)} new Workshop item(s) for submods: {', '.join(need_ids)}")
+            new_ids = create_workshop_items(steam, len(need_ids))
+            if len(new_ids) < len(need_ids):
+                success = False
+            pending.update(zip(need_ids, new_ids))
+
+        for meta, workshop_id in submods:
+            mod_id = meta["id"]
+            if workshop_id == 0:
+                workshop_id = pending.get(mod_id)
+                if workshop_id is None:
+                    success = False
+                    continue
+            mapping[mod_id] = workshop_id
+
+            title = meta["name"]
+            if title is None:
+                print(f"Warning: Submod '{mod_id}' has no name; Workshop title will not be updated.")
+
+            preview_path = meta["thumbnail"]
+            if not os.path.exists(preview_path):
+                preview_path = None
+
+            if not upload_release(steam.Workshop, meta["root"], preview_path, workshop_id, title):
+                success = False
+    finally:
+        if pending:
+            if flush_submod_updates(CONFIG_PATH, pending):
+                print(f"Updated submods list in {CONFIG_PATH} for {len(pending)} new item(s).")
+            else:
+                for mod_id, workshop_id in pending.items():
+                    print(
+                        f"Warning: Failed to update {CONFIG_PATH}. "
+                        f"Please add workshop_id = {workshop_id} for mod_id = '{mod_id}'."
+                    )
+                success = False
 
     return success
 
@@ -459,11 +620,9 @@ def _normalize_release_title(raw_name):
 
 def build_release(dev_mode=False, dev_name=None):
     # --- Generate Release Folder Name ---
-    dev_meta_path = os.path.join(ROOT_DIR, ".metadata", "metadata.json")
-
-    if os.path.exists(dev_meta_path):
-        with open(dev_meta_path, "r", encoding="utf-8-sig") as f:
-            meta_data = json.load(f)
+    if os.path.exists(DEV_META_PATH):
+        with open(DEV_META_PATH, "rb") as f:
+            meta_data = json.loads(f.read().decode("utf-8-sig"))
 
         raw_name = meta_data["name"]
         resolved_dev_name = dev_name if dev_mode and dev_name else raw_name
@@ -478,7 +637,7 @@ def build_release(dev_mode=False, dev_name=None):
         clean_name = clean_name.lower().replace(" ", "-")
         target_folder_name = f"{clean_name}-dev" if dev_mode else f"{clean_name}-release"
     else:
-        raise FileNotFoundError(f"Metadata file not found at {dev_meta_path}")
+        raise FileNotFoundError(f"Metadata file not found at {DEV_META_PATH}")
 
     release_dir = os.path.join(os.path.dirname(ROOT_DIR), target_folder_name)
 
@@ -490,16 +649,30 @@ def build_release(dev_mode=False, dev_name=None):
 
     os.makedirs(release_dir)
 
-    # 2. Copy Sources directly to Release Directory
-    for item in SOURCES:
+    # 2. Copy Sources directly to Release Directory. The subtrees are
+    # independent and the copy syscalls release the GIL, so copying them
+    # concurrently overlaps disk latency.
+    def _copy_source(item):
         src_path = os.path.join(ROOT_DIR, item)
         dest_path = os.path.join(release_dir, item)
 
-        if os.path.exists(src_path):
-            if os.path.isdir(src_path):
-                shutil.copytree(src_path, dest_path, dirs_exist_ok=True)
-            else:
-                shutil.copy(src_path, dest_path)
+        # One stat answers both the exists and isdir questions.
+        try:
+            src_stat = os.stat(src_path)
+        except FileNotFoundError:
+            return
+
+        if stat.S_ISDIR(src_stat.st_mode):
+            _fast_copytree(src_path, dest_path)
+        else:
+            # copyfile skips copy's trailing chmod and uses the platform
+            # zero-copy path (sendfile/CopyFile2) where available.
+            shutil.copyfile(src_path, dest_path)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(SOURCES))) as executor:
+        futures = [executor.submit(_copy_source, item) for item in SOURCES]
+        for future in futures:
+            future.result()
 
     # 3. Generate Release Metadata
     dest_meta_dir = os.path.join(release_dir, ".metadata")
@@ -508,8 +681,8 @@ def build_release(dev_mode=False, dev_name=None):
     if not os.path.exists(dest_meta_dir):
         os.makedirs(dest_meta_dir)
 
-    with open(dev_meta_path, "r", encoding="utf-8-sig") as f:
-        data = json.load(f)
+    # Reuse the metadata already parsed above instead of re-reading the file.
+    data = dict(meta_data)
 
     if dev_mode:
         data["name"] = resolved_dev_name
@@ -517,24 +690,31 @@ def build_release(dev_mode=False, dev_name=None):
         data["name"] = data["name"].removesuffix(" Dev")
         data["id"] = data["id"].removesuffix(".dev")
 
-    with open(dest_meta_path, "w", encoding="utf-8-sig") as f:
+    # Write-then-rename so an interrupted run can't leave truncated JSON.
+    tmp_meta_path = dest_meta_path + ".tmp"
+    with open(tmp_meta_path, "w", encoding="utf-8-sig") as f:
         json.dump(data, f, indent=4)
+    os.replace(tmp_meta_path, dest_meta_path)
 
     # 4. Handle Thumbnail
-    thumb_release = os.path.join(ROOT_DIR, ".metadata", "thumbnail-release.png")
-    thumb_std = os.path.join(ROOT_DIR, ".metadata", "thumbnail.png")
     thumb_dest = os.path.join(dest_meta_dir, "thumbnail.png")
 
+    # One directory scan answers every thumbnail existence check.
+    with os.scandir(SRC_META_DIR) as entries:
+        meta_names = {entry.name for entry in entries}
+
+    # copyfile, not copy: the generated release doesn't need source
+    # permissions replayed, so skip the extra chmod syscall per thumbnail.
     if dev_mode:
-        if os.path.exists(thumb_std):
-            shutil.copy(thumb_std, thumb_dest)
+        if "thumbnail.png" in meta_names:
+            shutil.copyfile(THUMB_STD_PATH, thumb_dest)
         else:
             thumb_dest = None
     else:
-        if os.path.exists(thumb_release):
-            shutil.copy(thumb_release, thumb_dest)
-        elif os.path.exists(thumb_std):
-            shutil.copy(thumb_std, thumb_dest)
+        if "thumbnail-release.png" in meta_names:
+            shutil.copyfile(THUMB_RELEASE_PATH, thumb_dest)
+        elif "thumbnail.png" in meta_names:
+            shutil.copyfile(THUMB_STD_PATH, thumb_dest)
         else:
             thumb_dest = None
 